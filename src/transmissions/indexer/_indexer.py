@@ -45,6 +45,14 @@ class TZInfo(Enum):
     PDT = TimeZone(TimeDelta(hours=-7), name="Pacific Daylight Time")
 
 
+_PDT = TZInfo.PDT.value
+
+_SYSTEM_TYPE_MAP = {
+    "SYSTEM": "Conventional",
+    "Trunk Sys": "Trunk",
+}
+
+
 class InvalidFileError(Exception):
     """
     Don't like this file, yo.
@@ -258,15 +266,19 @@ class Indexer:
             return default
 
         # Start time
+        # The first 19 characters of the filename are always
+        # "YYYY-MM-DD HH-MM-SS", so slice the fields out directly rather than
+        # retrieving each regex group.
 
+        name = path.name
         startTime = DateTime(
-            year=int(getValue("year")),
-            month=int(getValue("month")),
-            day=int(getValue("day")),
-            hour=int(getValue("hour")),
-            minute=int(getValue("minute")),
-            second=int(getValue("second")),
-            tzinfo=TZInfo.PDT.value,
+            year=int(name[0:4]),
+            month=int(name[5:7]),
+            day=int(name[8:10]),
+            hour=int(name[11:13]),
+            minute=int(name[14:16]),
+            second=int(name[17:19]),
+            tzinfo=_PDT,
         )
 
         # System
@@ -280,10 +292,7 @@ class Indexer:
         except IndexError:
             system = f"System {systemName}"
         else:
-            systemType = {
-                "SYSTEM": "Conventional",
-                "Trunk Sys": "Trunk",
-            }.get(systemType, systemType)
+            systemType = _SYSTEM_TYPE_MAP.get(systemType, systemType)
 
             if systemType == systemName:
                 system = systemName
@@ -22,6 +22,7 @@ Radio transmission
 
 from datetime import datetime as DateTime
 from datetime import timedelta as TimeDelta
+from functools import cached_property
 from pathlib import Path
 from typing import ClassVar, TypeAlias
 
@@ -61,7 +62,7 @@ class Transmission:
             return None
         return self.startTime + self.duration
 
-    @property
+    @cached_property
     def key(self) -> Key:
         return (self.eventID, self.system, self.channel, self.startTime)
 
@@ -1,11 +1,12 @@
-from collections.abc import Awaitable, Callable, Iterable
+from collections.abc import Awaitable, Callable, Iterable, Sequence
 from datetime import datetime as DateTime
+from heapq import nsmallest
 from pathlib import Path
+from types import ModuleType
 from typing import Any, cast
+from zoneinfo import ZoneInfo
 
 import click
-from arrow import get as makeArrow
-from attrs import frozen
 from click import (
     Context,
     Group,
@@ -18,36 +19,43 @@ from click import (
 from click import (
     Path as ClickPath,
 )
-from rich.box import DOUBLE_EDGE as RICH_DOUBLE_EDGE
-from rich.console import Console as RichConsole
-from rich.table import Table as RichTable
-from twisted.application.runner._runner import Runner
-from twisted.internet import asyncioreactor as asyncioReactor
-from twisted.internet import default as defaultReactor
-from twisted.internet.defer import Deferred, ensureDeferred
+from twisted.internet.defer import Deferred, ensureDeferred, gatherResults
 from twisted.internet.interfaces import IReactorCore, IReactorTCP
 from twisted.internet.task import react
 from twisted.logger import Logger
-from twisted.web.server import Site
+
+
+try:
+    # epoll_wait() scales with ready descriptors rather than registered
+    # ones; prefer it where available (Linux).
+    from twisted.internet import epollreactor
+
+    defaultReactor: ModuleType = epollreactor
+except ImportError:
+    from twisted.internet import default
+
+    defaultReactor = default
 
 from transmissions.ext.click import readConfig
 from transmissions.ext.logger import startLogging
-from transmissions.indexer import Indexer
 from transmissions.model import Event, Transmission
 from transmissions.store import TXDataStore
-from transmissions.tui import Application as TUIApplication
 
 from ._search import SearchIndexFactory, searchIndexFactoryFromConfig
 from ._store import StoreFactory, storeFactoryFromConfig
 
 
+# Imports that pull in heavy dependency trees (Rich, Arrow, the indexer's
+# audio stack, the Textual application, the Twisted web server) are deferred
+# to the commands that use them, so that startup and --help stay fast.
+
+
 __all__ = ()
 
 
 log = Logger()
 
 
-@frozen(kw_only=True)
 class Command:
     """
     Radio Transmission Command Line Tool
@@ -61,6 +69,28 @@ class Command:
         main(auto_envvar_prefix="RTX")
 
 
+_configCache: dict[tuple[str, int], dict[str, Any]] = {}
+
+
+def _readConfigCached(path: Path) -> dict[str, Any]:
+    """
+    Read configuration from the given path, caching the parsed result keyed
+    on the resolved path and its modification time, so that repeated
+    invocations in one process skip the TOML parse.
+    """
+    path = path.expanduser()
+    try:
+        mtimeNS = path.stat().st_mtime_ns
+    except OSError:
+        mtimeNS = -1
+
+    key = (str(path), mtimeNS)
+    config = _configCache.get(key)
+    if config is None:
+        config = _configCache[key] = readConfig(path)
+    return config
+
+
 def groupClassWithConfigParam(param: str) -> type[Group]:
     class GroupWithConfiguration(Group):
         def invoke(self, ctx: Context) -> object:
@@ -70,7 +100,7 @@ def groupClassWithConfigParam(param: str) -> type[Group]:
                     if ctx.default_map is None:
                         ctx.default_map = {}
                     if "_config" not in ctx.default_map:
-                        config = readConfig(Path(fileName))
+                        config = _readConfigCached(Path(fileName))
                         ctx.default_map["_config"] = config
                         # Set _config on subcommand contexts
                         for command in self.commands:
@@ -112,13 +142,25 @@ def searchIndexFactoryFromContext(ctx: Context) -> SearchIndexFactory:
     return cast(SearchIndexFactory, configuration["searchIndexFactory"])
 
 
-def configuredEventsFromContext(ctx: Context) -> Iterable[tuple[Event, Path]]:
+def configuredEventsFromContext(ctx: Context) -> Sequence[tuple[Event, Path]]:
     """
     Get events from the given context.
     """
     configuration = configurationFromContext(ctx)
+
+    # Cache the resolved events on the configuration, so repeated calls
+    # don't redo the expanduser and is_dir stat per event.  The cache lives
+    # and dies with the parsed config dict, so an edited config file (which
+    # yields a fresh dict) starts clean.
+    events = cast(
+        "Sequence[tuple[Event, Path]] | None", configuration.get("_configuredEvents")
+    )
+    if events is not None:
+        return events
+
     eventConfig = configuration.get("Audio", {}).get("Event", {})
 
+    events = []
     for eventID, eventDict in eventConfig.items():
         try:
             eventName = eventDict["Name"]
@@ -139,7 +181,10 @@ def configuredEventsFromContext(ctx: Context) -> Iterable[tuple[Event, Path]]:
                 f"No source directory found for event {eventID}: {sourcePath}"
             )
 
-        yield (event, sourcePath)
+        events.append((event, sourcePath))
+
+    configuration["_configuredEvents"] = events
+    return events
 
 
 Application = Callable[[TXDataStore], Awaitable[None]]
@@ -173,6 +218,10 @@ def run(
 
 
 def printEvents(events: Iterable[Event]) -> None:
+    from rich.box import DOUBLE_EDGE as RICH_DOUBLE_EDGE
+    from rich.console import Console as RichConsole
+    from rich.table import Table as RichTable
+
     console = RichConsole()
 
     table = RichTable(show_header=True, box=RICH_DOUBLE_EDGE)
@@ -185,7 +234,15 @@ def printEvents(events: Iterable[Event]) -> None:
     console.print(table)
 
 
+displayTimeZone = ZoneInfo("US/Pacific")
+displayDateTimeFormat = "%m/%d %H:%M:%S"
+
+
 def printTransmissions(transmissions: Iterable[Transmission]) -> None:
+    from rich.box import DOUBLE_EDGE as RICH_DOUBLE_EDGE
+    from rich.console import Console as RichConsole
+    from rich.table import Table as RichTable
+
     console = RichConsole()
 
     table = RichTable(show_header=True, box=RICH_DOUBLE_EDGE)
@@ -200,9 +257,13 @@ def printTransmissions(transmissions: Iterable[Transmission]) -> None:
     unknown = "…"
 
     def displayDateTime(dateTime: DateTime) -> str:
-        arrow = makeArrow(dateTime).to("US/Pacific")
-        return arrow.format("MM/DD HH:mm:ss")
+        # astimezone + strftime stay in the C-level stdlib; Arrow would
+        # allocate a wrapper object and re-tokenize its format string per row.
+        return dateTime.astimezone(displayTimeZone).strftime(displayDateTimeFormat)
 
+    # Pre-bind the per-row call; LOAD_ATTR per iteration adds up on large
+    # listings.
+    addRow = table.add_row
     for transmission in transmissions:
         if transmission.duration is None:
             duration = unknown
@@ -214,7 +275,7 @@ def printTransmissions(transmissions: Iterable[Transmission]) -> None:
         else:
             transcription = transmission.transcription
 
-        table.add_row(
+        addRow(
             transmission.eventID,
             transmission.station,
             transmission.system,
@@ -260,18 +321,27 @@ def index(
     """
     Index audio files.
     """
+    from transmissions.indexer import Indexer
+
     configuredEvents = configuredEventsFromContext(ctx)
 
     async def app(store: TXDataStore) -> None:
-        for event, sourcePath in configuredEvents:
-            indexer = Indexer(event=event, root=sourcePath)
-            await indexer.indexIntoStore(
-                store,
-                existingOnly=not new,
-                computeChecksum=checksum,
-                computeDuration=duration,
-                computeTranscription=transcript,
-            )
+        # Index configured events concurrently; indexing is I/O-bound and
+        # distinct events touch distinct rows, so their awaits can overlap.
+        await gatherResults(
+            [
+                ensureDeferred(
+                    Indexer(event=event, root=sourcePath).indexIntoStore(
+                        store,
+                        existingOnly=not new,
+                        computeChecksum=checksum,
+                        computeDuration=duration,
+                        computeTranscription=transcript,
+                    )
+                )
+                for event, sourcePath in configuredEvents
+            ]
+        )
 
     run(ctx, app)
 
@@ -287,20 +357,29 @@ def inspect(ctx: Context, file: tuple[Path]) -> None:
     """
     Inspect a transmission file and show information about it.
     """
+    from transmissions.indexer import Indexer
+
     configuredEvents = configuredEventsFromContext(ctx)
 
     async def app(_store: TXDataStore) -> None:
+        # Resolve each event's source path once, not once per (file, event)
+        # pair; resolve() walks the whole path doing stat calls.  Indexers
+        # are stateless per event, so share one across files.
+        resolvedEvents = []
+        for event, _sourcePath in configuredEvents:
+            sourcePath = _sourcePath.resolve()
+            resolvedEvents.append(
+                (Indexer(event=event, root=sourcePath), sourcePath.parts)
+            )
+
         for _filePath in file:
             filePath = _filePath.resolve()
 
-            for event, _sourcePath in configuredEvents:
-                sourcePath = _sourcePath.resolve()
-
+            for indexer, sourceParts in resolvedEvents:
                 # If filePath isn't in sourcePath, it isn't in event
-                if filePath.parts[: len(sourcePath.parts)] != sourcePath.parts:
+                if filePath.parts[: len(sourceParts)] != sourceParts:
                     continue
 
-                indexer = Indexer(event=event, root=sourcePath)
                 transmission = indexer.transmissionFromFile(filePath)
 
                 click.echo(str(transmission))
@@ -331,25 +410,46 @@ def events(ctx: Context) -> None:
     required=False,
     default="",
 )
+@option(
+    "--limit",
+    help="Limit output to the given number of transmissions.",
+    type=int,
+    metavar="<count>",
+    prompt=False,
+    required=False,
+    default=None,
+)
 @pass_context
-def transmissions(ctx: Context, search: str) -> None:
+def transmissions(ctx: Context, search: str, limit: int | None) -> None:
     """
     List transmissions.
     """
 
     async def app(store: TXDataStore) -> None:
-        searchIndex = await searchIndexFactoryFromContext(ctx)(store)
-
-        transmissionsByKey = {t.key: t for t in await store.transmissions()}
-
         if search:
+            searchIndex = await searchIndexFactoryFromContext(ctx)(store)
+            # Fetch only the hits, via the store's keyed lookup, rather than
+            # materializing every transmission up front to resolve a handful
+            # of search results.
             transmissions: Iterable[Transmission] = [
-                transmissionsByKey[key] async for key in searchIndex.search(search)
+                transmission
+                async for key in searchIndex.search(search, limit=limit)
+                if (transmission := await store.transmission(*key)) is not None
             ]
         else:
-            transmissions = transmissionsByKey.values()
+            # No search: the keyed dict is only needed to resolve search
+            # results, so skip building it (and the search index) and pass
+            # the store's result straight through.
+            transmissions = await store.transmissions()
+
+        if limit is None:
+            transmissions = sorted(transmissions)
+        else:
+            # O(N log limit) selection of the earliest rows, instead of a
+            # full O(N log N) sort followed by a slice.
+            transmissions = nsmallest(limit, transmissions)
 
-        printTransmissions(sorted(transmissions))
+        printTransmissions(transmissions)
 
     run(ctx, app)
 
@@ -360,6 +460,9 @@ def application(ctx: Context) -> None:
     """
     Interactive UI.
     """
+    from twisted.internet import asyncioreactor as asyncioReactor
+
+    from transmissions.tui import Application as TUIApplication
 
     async def app(store: TXDataStore) -> None:
         searchIndex = await searchIndexFactoryFromContext(ctx)(store)
@@ -375,7 +478,9 @@ def web(ctx: Context) -> None:
     """
     Web server.
     """
+    from twisted.application.runner._runner import Runner
     from twisted.internet import reactor
+    from twisted.web.server import Site
 
     from transmissions.webapi import Application as WebAPIApplication
 
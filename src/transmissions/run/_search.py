@@ -1,5 +1,6 @@
 from collections.abc import Awaitable, Callable
 from pathlib import Path
+from stat import S_ISDIR
 from typing import Any
 
 from transmissions.search import Location, TransmissionsIndex
@@ -16,19 +17,30 @@ SearchIndexFactory = Callable[[TXDataStore], Awaitable[TransmissionsIndex]]
 def searchIndexFactoryFromConfig(configuration: dict[str, Any]) -> SearchIndexFactory:
     searchConfig = configuration.get("SearchIndex", {})
     fileName = searchConfig.get("File", "~/rtx.whoosh_index")
+    # Expand once here rather than on every factory call.
+    configuredIndexPath = Path(fileName).expanduser() if fileName else None
 
     async def factory(store: TXDataStore) -> TransmissionsIndex:
         reindex = True
 
-        if fileName:
-            indexPath = Path(fileName).expanduser()
+        if configuredIndexPath is not None:
+            indexPath = configuredIndexPath
             if isinstance(store, SQLiteDataStore):
-                if (
-                    indexPath.is_dir()
-                    and store.dbPath is not None
-                    and indexPath.stat().st_mtime > store.dbPath.stat().st_mtime
-                ):
-                    reindex = False
+                # One stat per path answers both "is it a directory" and
+                # "which is newer"; pathlib's is_dir()/stat() pair would
+                # stat the index twice.
+                if store.dbPath is not None:
+                    try:
+                        indexStat = indexPath.stat()
+                        dbStat = store.dbPath.stat()
+                    except OSError:
+                        pass
+                    else:
+                        if (
+                            S_ISDIR(indexStat.st_mode)
+                            and indexStat.st_mtime > dbStat.st_mtime
+                        ):
+                            reindex = False
             else:
                 raise NotImplementedError("Don't know whether to reindex")
             location: Location | Path = indexPath
@@ -28,9 +28,11 @@ def sqliteStoreFactoryFromConfig(storeConfig: dict[str, Any]) -> StoreFactory:
     from transmissions.store.sqlite import DataStore
 
     fileName = storeConfig.get("File", "~/rtx.sqlite")
+    # Expand once here rather than on every factory call.
+    dbPath = Path(fileName).expanduser()
 
     async def factory() -> TXDataStore:
-        store = DataStore(dbPath=Path(fileName).expanduser())
+        store = DataStore(dbPath=dbPath)
         await store.upgradeSchema()
         return store
 
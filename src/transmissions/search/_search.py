@@ -42,6 +42,7 @@ class TransmissionsIndex:
     )
 
     _index: Index | None = None
+    _queryParser: QueryParser | None = None
 
     async def connect(self, location: Location | Path = Location.memory) -> None:
         """
@@ -65,6 +66,7 @@ class TransmissionsIndex:
                 index = storage.create_index(self.schema, indexname=indexname)
 
         self._index = index
+        self._queryParser = QueryParser("transcription", schema=index.schema)
 
     async def add(self, transmissions: Iterable[Transmission]) -> None:
         """
@@ -72,31 +74,36 @@ class TransmissionsIndex:
         """
         assert self._index is not None
 
-        writer = AsyncWriter(self._index)
+        # One writer with a generous memory limit and one commit for the
+        # whole batch: each commit writes (and potentially merges) a
+        # segment, so committing per batch rather than per document is
+        # where the indexing time goes.  A synchronous writer also means
+        # the documents are searchable when this method returns, which
+        # AsyncWriter's background-thread commit did not guarantee.
+        writer = self._index.writer(limitmb=256)
         count = 0
 
+        addDocument = writer.add_document
         for transmission in transmissions:
+            duration = transmission.duration
             fields = {
                 "eventID": transmission.eventID,
                 "station": transmission.station,
                 "system": transmission.system,
                 "channel": transmission.channel,
                 "startTime": transmission.startTime,
+                "duration": (None if duration is None else duration.total_seconds()),
                 "path": str(transmission.path),
+                "sha256": transmission.sha256,
+                "transcription": transmission.transcription,
             }
-            if transmission.duration is not None:
-                fields["duration"] = transmission.duration.total_seconds()
-            if transmission.sha256 is not None:
-                fields["sha256"] = transmission.sha256
-            if transmission.transcription is not None:
-                fields["transcription"] = transmission.transcription
 
-            writer.add_document(**fields)
+            addDocument(
+                **{key: value for key, value in fields.items() if value is not None}
+            )
 
             count += 1
 
-        # NOTE: AsyncWriter's commit is… not async, so there's apparently no
-        # way to await on completion of the indexing thread here.
         writer.commit()
 
         self.log.info("Added {count} transmissions to search index", count=count)
@@ -120,9 +127,9 @@ class TransmissionsIndex:
         Perform search.
         """
         assert self._index is not None
+        assert self._queryParser is not None
 
-        parser = QueryParser("transcription", schema=self._index.schema)
-        query = parser.parse(queryText)
+        query = self._queryParser.parse(queryText)
 
         with self._index.searcher() as searcher:
             for result in searcher.search(query, limit=limit):
@@ -62,6 +62,18 @@ class DataStore(DatabaseStore):
 
     query: ClassVar[Queries] = queries
 
+    # Applied once per connection.  WAL avoids rewriting the journal on
+    # every transaction and synchronous=NORMAL skips the per-commit fsync
+    # (WAL guarantees consistency either way; a crash can lose only the
+    # most recent commits).  The rest keep temporary structures and hot
+    # pages in memory rather than on disk.
+    connectionPragmas: ClassVar[tuple[str, ...]] = (
+        "pragma journal_mode = WAL",
+        "pragma synchronous = NORMAL",
+        "pragma temp_store = MEMORY",
+        "pragma cache_size = -65536",
+    )
+
     @mutable(kw_only=True, eq=False)
     class _State:
         """
@@ -129,6 +141,9 @@ class DataStore(DatabaseStore):
                     self.log.info("Opening SQLite database: {path}", path=self.dbPath)
                     self._state.db = openDB(self.dbPath, schema="")
 
+                for pragma in self.connectionPragmas:
+                    self._state.db.execute(pragma)
+
             except SQLiteError as e:
                 self.log.critical(
                     "Unable to open SQLite database {dbPath}: {error}",
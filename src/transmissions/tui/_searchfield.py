@@ -1,6 +1,9 @@
+from typing import ClassVar
+
 from textual import on
 from textual.app import ComposeResult
 from textual.message import Message
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Input, Static
 
@@ -13,6 +16,8 @@ class SearchField(Static):
     Search field.
     """
 
+    debounceDelay: ClassVar[float] = 0.12
+
     class QueryUpdated(Message):
         """
         Search field updated message.
@@ -27,13 +32,33 @@ class SearchField(Static):
         def control(self) -> Widget:
             return self._control
 
+    _debounceTimer: Timer | None = None
+
     def compose(self) -> ComposeResult:
         yield Input(
             id="SearchField",
             placeholder=" \N{RIGHT-POINTING MAGNIFYING GLASS} Search...",
         )
 
+    def _cancelDebounce(self) -> None:
+        if self._debounceTimer is not None:
+            self._debounceTimer.stop()
+            self._debounceTimer = None
+
+    @on(Input.Changed)
+    def handle_changed(self, message: Input.Changed) -> None:
+        # Coalesce bursts of keystrokes into a single query update.
+        query = message.value
+        self._cancelDebounce()
+
+        def post() -> None:
+            self._debounceTimer = None
+            self.post_message(self.QueryUpdated(self, query))
+
+        self._debounceTimer = self.set_timer(self.debounceDelay, post)
+
     @on(Input.Submitted)
     def handle_update(self, message: Input.Submitted) -> None:
         query = message.value
+        self._cancelDebounce()
         self.post_message(self.QueryUpdated(self, query))
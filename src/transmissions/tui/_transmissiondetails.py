@@ -1,18 +1,69 @@
 from datetime import datetime as DateTime
+from functools import lru_cache
 from pathlib import Path
 from typing import ClassVar
+from zoneinfo import ZoneInfo
 
-from arrow import get as makeArrow
-from rich.markup import escape
 from textual.reactive import reactive
 from textual.widgets import Static
 
-from ._util import TransmissionTuple, dateTimeFromText, optionalEscape
+from ._util import TransmissionTuple, dateTimeTextAsDisplayText, fastEscape
 
 
 __all__ = ()
 
 
+@lru_cache(maxsize=64)
+def _renderDetails(
+    transmission: TransmissionTuple,
+    startTime: str,
+    *,
+    showFileInfo: bool,
+    pathAvailable: bool,
+) -> str:
+    """
+    Assemble the details markup for a transmission; memoized so re-selecting
+    a recently viewed row is a cache hit.
+    """
+    # Text fields arrive pre-escaped from transmissionAsTuple; only the raw
+    # path needs escaping here.
+    eventID: str = transmission.eventID
+    station: str = transmission.station
+    system: str = transmission.system
+    channel: str = transmission.channel
+    duration: float | None = transmission.duration
+    path: str = fastEscape(transmission.path)
+    sha256: str | None = transmission.sha256
+    transcription: str | None = transmission.transcription
+
+    details: list[str] = []
+
+    details.append(
+        f"([bold yellow]{eventID}[/])"
+        f" Station [bold yellow]{station}[/]"
+        f" on {system} [bold yellow]{channel}[/]"
+        f" {startTime} ({duration}s)"
+    )
+
+    if not pathAvailable:
+        details.append("[bold red]Audio file is not available[/]")
+
+    if showFileInfo:
+        if sha256 is None:
+            details.append(path)
+        else:
+            details.append(f"SHA {sha256}: {path}")
+
+    details.append("")
+
+    if transcription is None:
+        details.append("[i](transcription not available)[/]")
+    else:
+        details.append(transcription.strip())
+
+    return "\n".join(details)
+
+
 class TransmissionDetails(Static):
     """
     Transmission detail view.
@@ -31,60 +82,51 @@ class TransmissionDetails(Static):
 
     transmission: reactive[TransmissionTuple | None] = reactive(None)
     showFileInfo = reactive(True)
-    dateTimeDisplayFormat = reactive("[on] ddd YY/MM/DD [at] HH:mm:ss")
+    dateTimeDisplayFormat = reactive("on %a %y/%m/%d at %H:%M:%S")
     timeZone = reactive("US/Pacific")
 
+    _pendingRender: bool = False
+
     def dateTimeAsDisplayText(self, dateTime: DateTime) -> str:
-        arrow = makeArrow(dateTime).to(self.timeZone)
-        return arrow.format(self.dateTimeDisplayFormat)
+        return dateTime.astimezone(ZoneInfo(self.timeZone)).strftime(
+            self.dateTimeDisplayFormat
+        )
 
     def dateTimeTextAsDisplayText(self, text: str) -> str:
-        dateTime = dateTimeFromText(text)
-        return self.dateTimeAsDisplayText(dateTime)
+        return dateTimeTextAsDisplayText(
+            text, self.timeZone, self.dateTimeDisplayFormat
+        )
 
     def updateDetails(self) -> None:
         if self.transmission is None:
             return
 
-        pathAvailable = Path(self.transmission[7]).is_file()
-
-        # key: str = self.transmission[0]
-        eventID: str = escape(self.transmission[1])
-        station: str = escape(self.transmission[2])
-        system: str = escape(self.transmission[3])
-        channel: str = escape(self.transmission[4])
-        startTime: str = escape(self.dateTimeTextAsDisplayText(self.transmission[5]))
-        duration: float | None = self.transmission[6]
-        path: str = escape(self.transmission[7])
-        sha256: str | None = optionalEscape(self.transmission[8])
-        transcription: str | None = optionalEscape(self.transmission[9])
-
-        details: list[str] = []
-
-        details.append(
-            f"([bold yellow]{eventID}[/])"
-            f" Station [bold yellow]{station}[/]"
-            f" on {system} [bold yellow]{channel}[/]"
-            f" {startTime} ({duration}s)"
-        )
-
-        if not pathAvailable:
-            details.append("[bold red]Audio file is not available[/]")
-
-        if self.showFileInfo:
-            if sha256 is None:
-                details.append(path)
-            else:
-                details.append(f"SHA {sha256}: {path}")
+        if not self.is_mounted or not self.display:
+            # Nobody would see the render; do it when we become visible.
+            self._pendingRender = True
+            return
+        self._pendingRender = False
 
-        details.append("")
+        pathAvailable = Path(self.transmission.path).is_file()
+        startTime = fastEscape(
+            self.dateTimeTextAsDisplayText(self.transmission.startTime)
+        )
 
-        if transcription is None:
-            details.append("[i](transcription not available)[/]")
-        else:
-            details.append(transcription.strip())
+        self.update(
+            _renderDetails(
+                self.transmission,
+                startTime,
+                showFileInfo=self.showFileInfo,
+                pathAvailable=pathAvailable,
+            )
+        )
 
-        self.update("\n".join(details))
+    def on_show(self) -> None:
+        if self._pendingRender:
+            try:
+                self.updateDetails()
+            except Exception as e:  # noqa: BLE001
+                self.log(f"Unable to update transmission details: {e}")
 
     def watch_transmission(self, transmission: str) -> None:
         try:
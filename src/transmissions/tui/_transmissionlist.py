@@ -1,9 +1,12 @@
-from collections.abc import Sequence
+from asyncio import sleep
+from collections.abc import Callable, Sequence
 from datetime import datetime as DateTime
 from enum import StrEnum, auto
+from functools import lru_cache
+from operator import itemgetter
+from typing import ClassVar
+from zoneinfo import ZoneInfo
 
-from arrow import get as makeArrow
-from rich.markup import escape
 from rich.text import Text
 from textual import on
 from textual.app import ComposeResult
@@ -12,7 +15,7 @@ from textual.reactive import reactive
 from textual.widget import Widget
 from textual.widgets import DataTable, Static
 
-from ._util import TransmissionTuple, dateTimeFromText
+from ._util import TransmissionTuple, dateTimeTextAsDisplayText, fastEscape
 
 
 __all__ = ()
@@ -29,10 +32,35 @@ TransmissionTableRowCells = tuple[
     str | Text,  # sha256
     str,  # transcription
 ]
-TransmissionTableRowData = tuple[TransmissionTableRowCells, str]
+TransmissionTableRowData = tuple[TransmissionTableRowCells, str, DateTime]
 TransmissionTableData = Sequence[TransmissionTableRowData]
 
 
+def _noCells(_row: TransmissionTableRowCells) -> tuple:
+    return ()
+
+
+_missingCell = Text("-", justify="center")
+
+
+@lru_cache(maxsize=2048)
+def _durationCell(duration: float) -> Text:
+    """
+    Render a duration cell, memoized since many transmissions share common
+    durations.
+    """
+    return Text(f"{duration}s", justify="right")
+
+
+@lru_cache(maxsize=4096)
+def _dateTimeAsDisplayText(dateTime: DateTime, timeZone: str, format: str) -> str:
+    """
+    Format a datetime for display, memoized since many rows share the same
+    time zone and display format.
+    """
+    return dateTime.astimezone(ZoneInfo(timeZone)).strftime(format)
+
+
 class TransmissionList(Static):
     """
     List of transmissions.
@@ -83,145 +111,260 @@ class TransmissionList(Static):
             )
         )
     )
-    dateTimeDisplayFormat = reactive("ddd YY/MM/DD HH:mm:ss")
+    dateTimeDisplayFormat = reactive("%a %y/%m/%d %H:%M:%S")
     timeZone = reactive("US/Pacific")
     displayKeys: reactive[frozenset[str] | None] = reactive(None)
 
     def __init__(self, id: str) -> None:
         self._tableData: TransmissionTableData = ()
+        self._builtTransmissions: Sequence[TransmissionTuple] | None = None
+        self._table: DataTable | None = None
+        self._visibleKeys: set[str] = set()
+        self._columnIndices: tuple[int, ...] = ()
+        self._getCells: Callable[[TransmissionTableRowCells], tuple] = _noCells
         super().__init__(id=id)
 
+    def _computeColumnLayout(self) -> None:
+        """
+        Precompute the displayed column indices and cell extractor, so that
+        table rebuilds don't re-test column membership per call.
+        """
+        columns = tuple(
+            index
+            for index, column in enumerate(self.Column)
+            if column in self.displayColumns
+        )
+        self._columnIndices = columns
+
+        if len(columns) == 1:
+            columnIndex = columns[0]
+
+            def getCells(row: TransmissionTableRowCells) -> tuple:
+                return (row[columnIndex],)
+
+            self._getCells = getCells
+        elif columns:
+            self._getCells = itemgetter(*columns)
+        else:
+            self._getCells = _noCells
+
     def compose(self) -> ComposeResult:
         yield DataTable(
             cursor_type="row",
             zebra_stripes=True,
         )
 
-    def on_mount(self) -> None:
-        headerNames = {
-            self.Column.event: "Event",
-            self.Column.station: "Station",
-            self.Column.system: "System",
-            self.Column.channel: "Channel",
-            self.Column.startTime: "Start",
-            self.Column.duration: "Duration",
-            self.Column.path: "Path",
-            self.Column.sha256: "SHA256",
-            self.Column.transcription: "Transcription",
-        }
-
-        table = self.query_one(DataTable)
+    headerNames: ClassVar[dict[Column, str]] = {
+        Column.event: "Event",
+        Column.station: "Station",
+        Column.system: "System",
+        Column.channel: "Channel",
+        Column.startTime: "Start",
+        Column.duration: "Duration",
+        Column.path: "Path",
+        Column.sha256: "SHA256",
+        Column.transcription: "Transcription",
+    }
+
+    def _rebuildColumns(self) -> None:
+        """
+        Make the table's columns match the displayed column set.
+        """
+        table = self._table
+        assert table is not None
+        table.clear(columns=True)
         for column in self.Column:
             if column in self.displayColumns:
-                table.add_column(headerNames[column], key=column)
+                table.add_column(self.headerNames[column], key=column)
+
+    def on_mount(self) -> None:
+        self._computeColumnLayout()
+        self._table = self.query_one(DataTable)
+        self._rebuildColumns()
 
     def dateTimeAsDisplayText(self, dateTime: DateTime) -> str:
-        arrow = makeArrow(dateTime).to(self.timeZone)
-        return arrow.format(self.dateTimeDisplayFormat)
+        return _dateTimeAsDisplayText(
+            dateTime, self.timeZone, self.dateTimeDisplayFormat
+        )
 
     def dateTimeTextAsDisplayText(self, text: str) -> str:
-        dateTime = dateTimeFromText(text)
-        return self.dateTimeAsDisplayText(dateTime)
-
-    def dateTimeFromDisplayText(self, displayText: str) -> DateTime:
-        arrow = makeArrow(displayText, self.dateTimeDisplayFormat)
-        return arrow.datetime
+        return dateTimeTextAsDisplayText(
+            text, self.timeZone, self.dateTimeDisplayFormat
+        )
 
     def updateTable(self) -> None:
         self.log("Updating table")
-        columns = []
-
-        if self.Column.event in self.displayColumns:
-            columns.append(0)
-        if self.Column.station in self.displayColumns:
-            columns.append(1)
-        if self.Column.system in self.displayColumns:
-            columns.append(2)
-        if self.Column.channel in self.displayColumns:
-            columns.append(3)
-        if self.Column.startTime in self.displayColumns:
-            columns.append(4)
-        if self.Column.duration in self.displayColumns:
-            columns.append(5)
-        if self.Column.path in self.displayColumns:
-            columns.append(6)
-        if self.Column.sha256 in self.displayColumns:
-            columns.append(7)
-        if self.Column.transcription in self.displayColumns:
-            columns.append(8)
-
-        table = self.query_one(DataTable)
-        table.clear()
-        for row, key in self._tableData:
-            if self.displayKeys is None or key in self.displayKeys:
-                table.add_row(*[row[column] for column in columns], key=key)
-
-        # def sortKey(startTime: str) -> Any:
-        #     return self.dateTimeFromDisplayText(startTime)
-
-        # table.sort(self.Column.startTime, key=sortKey)
-
-    def updateTransmissions(self) -> None:
+        getCells = self._getCells
+
+        table = self._table
+        assert table is not None
+        visibleKeys: set[str] = set()
+        displayKeys = self.displayKeys
+        # batch_update is app-level in Textual; it holds repaints while the
+        # table is cleared and refilled.
+        with self.app.batch_update():
+            table.clear()
+            # Pre-bind the per-row calls; LOAD_ATTR per iteration adds up.
+            addRow = table.add_row
+            addVisibleKey = visibleKeys.add
+            if displayKeys is None:
+                for row, key, _startTime in self._tableData:
+                    addRow(*getCells(row), key=key)
+                    addVisibleKey(key)
+            else:
+                for row, key, _startTime in self._tableData:
+                    if key in displayKeys:
+                        addRow(*getCells(row), key=key)
+                        addVisibleKey(key)
+        self._visibleKeys = visibleKeys
+
+    def filterTable(self) -> None:
+        """
+        Apply the current display keys to the table, removing newly hidden
+        rows in place when possible.
+
+        A full rebuild is O(n) row insertions on every query change; when a
+        query only narrows the visible set (the common case while typing), we
+        can instead remove just the hidden rows.
+        """
+        displayKeys = self.displayKeys
+        if displayKeys is None:
+            newVisibleKeys = {key for _row, key, _startTime in self._tableData}
+        else:
+            newVisibleKeys = {
+                key for _row, key, _startTime in self._tableData if key in displayKeys
+            }
+
+        if newVisibleKeys - self._visibleKeys:
+            # Rows became visible; the DataTable can't insert rows at a sorted
+            # position, so rebuild.
+            self.updateTable()
+            return
+
+        table = self._table
+        assert table is not None
+        for key in self._visibleKeys - newVisibleKeys:
+            table.remove_row(key)
+        self._visibleKeys = newVisibleKeys
+
+    async def updateTransmissions(self) -> None:
         self.log(f"Updating {len(self.transmissions)} transmissions")
+
+        if self.transmissions == self._builtTransmissions:
+            # Reassigned but structurally unchanged; the cached rows and the
+            # table are already current.
+            self.log("Transmissions unchanged; skipping rebuild")
+            return
+
         tableData: list[TransmissionTableRowData] = []
 
-        for transmission in self.transmissions:
-            key = transmission[0]
-            eventID = transmission[1]
-            station = transmission[2]
-            system = transmission[3]
-            channel = transmission[4]
-            startTime = transmission[5]
-            duration = transmission[6]
-            path = transmission[7]
-            sha256 = transmission[8]
-            transcription = transmission[9]
+        # Yield to the event loop periodically so a large rebuild doesn't
+        # freeze the UI; run_worker(exclusive=True) cancels a stale build
+        # when a new dataset arrives.
+        chunkSize = 500
+
+        # Unpacking in the for-clause replaces ten attribute lookups per row
+        # with a single C-level UNPACK_SEQUENCE.
+        appendRowData = tableData.append
+        for index, (
+            key,
+            eventID,
+            station,
+            system,
+            channel,
+            _startTimeText,
+            duration,
+            path,
+            sha256,
+            transcription,
+            startTimeDateTime,
+        ) in enumerate(self.transmissions):
+            if index and not index % chunkSize:
+                await sleep(0)
 
             if duration is None:
-                durationCell = Text("-", justify="center")
+                durationCell = _missingCell
             else:
-                durationCell = Text(escape(f"{duration}s"), justify="right")
+                durationCell = _durationCell(duration)
 
             if sha256 is None:
-                sha256Cell: str | Text = Text("-", justify="center")
+                sha256Cell: str | Text = _missingCell
             else:
-                sha256Cell = escape(sha256)
+                sha256Cell = sha256
 
             if transcription is None:
-                transcription = "…"
+                transcriptionCell = "…"
+            else:
+                transcriptionCell = transcription
 
+            # Text fields arrive pre-escaped from transmissionAsTuple; only
+            # the raw path and the freshly formatted start time need escaping
+            # here.
             cells: TransmissionTableRowCells = (
-                escape(eventID),
-                escape(station),
-                escape(system),
-                escape(channel),
-                escape(self.dateTimeTextAsDisplayText(startTime)),
+                eventID,
+                station,
+                system,
+                channel,
+                fastEscape(self.dateTimeAsDisplayText(startTimeDateTime)),
                 durationCell,
-                escape(path),
+                fastEscape(path),
                 sha256Cell,
-                escape(transcription),
+                transcriptionCell,
             )
 
-            rowData: TransmissionTableRowData = (cells, key)
-            tableData.append(rowData)
+            rowData: TransmissionTableRowData = (cells, key, startTimeDateTime)
+            appendRowData(rowData)
+
+        # Sort rows by start time before insertion, using the parsed datetime
+        # directly; sorting the DataTable afterwards would re-parse the
+        # formatted display text for every comparison.
+        tableData.sort(key=lambda rowData: rowData[2])
 
         self._tableData = tuple(tableData)
+        self._builtTransmissions = self.transmissions
         self.updateTable()
 
+    def bulkSetTransmissions(self, transmissions: Sequence[TransmissionTuple]) -> None:
+        """
+        Set transmissions for an initial bulk load, skipping the reactive
+        machinery (equality check, watcher scheduling) and starting a single
+        build worker directly. Subsequent updates should assign the reactive
+        normally.
+        """
+        self.set_reactive(TransmissionList.transmissions, transmissions)
+        self.run_worker(self.updateTransmissions(), exclusive=True)
+
     def watch_transmissions(self, transmissions: Sequence[TransmissionTuple]) -> None:
         self.log(f"Received {len(self.transmissions)} transmissions")
         try:
-            self.updateTransmissions()
+            self.run_worker(self.updateTransmissions(), exclusive=True)
         except Exception as e:  # noqa: BLE001
             self.log(f"Unable to update transmissions: {e}")
 
-    def watch_displayKeys(self, displayKeys: frozenset[str]) -> None:
-        self.log(f"Received display keys: {displayKeys}")
+    def watch_displayColumns(self, displayColumns: frozenset[str]) -> None:
+        if not self.is_mounted:
+            return
+        self._computeColumnLayout()
         try:
+            # The table's columns must track the displayed set, or refilled
+            # rows won't line up with the headers.
+            self._rebuildColumns()
             self.updateTable()
         except Exception as e:  # noqa: BLE001
             self.log(f"Unable to update table: {e}")
 
+    def watch_displayKeys(self, displayKeys: frozenset[str]) -> None:
+        # Log a count, not the keys: serializing the full set is more
+        # expensive than the filtering it accompanies.
+        self.log(
+            "Received display keys: "
+            f"{'all' if displayKeys is None else len(displayKeys)}"
+        )
+        try:
+            self.filterTable()
+        except Exception as e:  # noqa: BLE001
+            self.log(f"Unable to update table: {e}")
+
     @on(DataTable.RowSelected)
     def handle_row_selected(self, message: DataTable.RowSelected) -> None:
         key = message.row_key.value
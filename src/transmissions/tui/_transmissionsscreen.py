@@ -1,4 +1,9 @@
-from collections.abc import Sequence
+from asyncio import sleep
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from sys import intern
 from typing import ClassVar, cast
 
 from textual import on
@@ -14,36 +19,55 @@ from ._header import Header
 from ._searchfield import SearchField
 from ._transmissiondetails import TransmissionDetails
 from ._transmissionlist import TransmissionList
-from ._util import TransmissionTuple, dateTimeAsText
+from ._util import TransmissionTuple, dateTimeAsText, fastEscape, optionalEscape
 
 
 __all__ = ()
 
 
 def transmissionTableKey(key: Transmission.Key) -> str:
-    return ":".join(str(i) for i in key)
+    eventID, system, channel, startTime = key
+    return f"{eventID}:{system}:{channel}:{startTime.isoformat()}"
 
 
+@lru_cache(maxsize=65536)
 def transmissionAsTuple(key: str, transmission: Transmission) -> TransmissionTuple:
-    if transmission.duration is None:
+    # Memoized: Transmission is frozen (hashable), so a screen remount reuses
+    # the tuples built for the previous mount instead of redoing the
+    # formatting and escaping for every row.
+    d = transmission.duration
+    if d is None:
         duration = None
     else:
-        duration = transmission.duration.total_seconds()
-
-    return (
+        # Equivalent to total_seconds(), but reads the C-level timedelta
+        # fields directly instead of a Python-level method call per row.
+        duration = d.days * 86400.0 + d.seconds + d.microseconds * 1e-6
+
+    # Text fields are escaped here, once per transmission, so that the list
+    # and details views can render them without re-escaping on every redraw.
+    # The path is kept raw because it is also used for file system access.
+    # The categorical fields take few distinct values, so intern them: all
+    # rows share one object per value and the escape cache hits on identity.
+    return TransmissionTuple(
         key,
-        transmission.eventID,
-        transmission.station,
-        transmission.system,
-        transmission.channel,
+        fastEscape(intern(transmission.eventID)),
+        fastEscape(intern(transmission.station)),
+        fastEscape(intern(transmission.system)),
+        fastEscape(intern(transmission.channel)),
         dateTimeAsText(transmission.startTime),
         duration,
         str(transmission.path),
-        transmission.sha256,
-        transmission.transcription,
+        optionalEscape(transmission.sha256),
+        optionalEscape(transmission.transcription),
+        transmission.startTime,
     )
 
 
+def _transmissionItemAsTuple(item: tuple[str, Transmission]) -> TransmissionTuple:
+    key, transmission = item
+    return transmissionAsTuple(key, transmission)
+
+
 class TransmissionsScreen(Screen):
     """
     Transmissions screen.
@@ -59,25 +83,58 @@ class TransmissionsScreen(Screen):
 
     def __init__(
         self,
-        transmissions: Sequence[Transmission],
+        transmissions: Sequence[Transmission] | Mapping[str, Transmission],
         searchIndex: TransmissionsIndex,
     ) -> None:
-        self.transmissionsByKey = {
-            transmissionTableKey(transmission.key): transmission
-            for transmission in transmissions
-        }
+        if isinstance(transmissions, dict):
+            # Already keyed; reuse it rather than rebuilding.
+            self.transmissionsByKey = transmissions
+        elif isinstance(transmissions, Mapping):
+            self.transmissionsByKey = dict(transmissions)
+        else:
+            # map/zip keep the key map construction on dict's C-level
+            # bulk-insert path instead of a per-item comprehension.
+            keys = map(transmissionTableKey, map(attrgetter("key"), transmissions))
+            self.transmissionsByKey = dict(zip(keys, transmissions, strict=True))
         self.selectedTransmission: Transmission | None = None
         self.searchIndex = searchIndex
+        self._tupleByKey: dict[str, TransmissionTuple] = {}
+        self._transmissionList: TransmissionList | None = None
+        self._transmissionDetails: TransmissionDetails | None = None
+        self._footer: Footer | None = None
 
         super().__init__()
 
     async def on_mount(self) -> None:
-        transmissionList = cast(TransmissionList, self.query_one("TransmissionList"))
-        transmissionList.transmissions = tuple(
-            transmissionAsTuple(key, transmission)
-            for key, transmission in self.transmissionsByKey.items()
+        # Build tuples in batches, yielding to the event loop between batches
+        # so the UI can paint during startup on a large catalog; map over the
+        # C-implemented items() view avoids a Python generator frame per
+        # transmission.
+        batchSize = 1000
+        tupleByKey: dict[str, TransmissionTuple] = {}
+        items = iter(self.transmissionsByKey.items())
+        while batch := list(islice(items, batchSize)):
+            tupleByKey.update(
+                zip(
+                    (key for key, _transmission in batch),
+                    map(_transmissionItemAsTuple, batch),
+                    strict=True,
+                )
+            )
+            await sleep(0)
+
+        self._tupleByKey = tupleByKey
+
+        # Cache widget lookups; query_one walks the widget tree per call.
+        transmissionList = self._transmissionList = cast(
+            TransmissionList, self.query_one("TransmissionList")
+        )
+        self._transmissionDetails = cast(
+            TransmissionDetails, self.query_one("TransmissionDetails")
         )
-        footer = cast(Footer, self.query_one("Footer"))
+        footer = self._footer = cast(Footer, self.query_one("Footer"))
+
+        transmissionList.bulkSetTransmissions(tuple(tupleByKey.values()))
         footer.totalTransmissions = footer.displayedTransmissions = len(
             self.transmissionsByKey
         )
@@ -92,21 +149,22 @@ class TransmissionsScreen(Screen):
         self, message: TransmissionList.TransmissionSelected
     ) -> None:
         self.selectedTransmission = self.transmissionsByKey[message.key]
-        self.log(f"Transmission selected: {self.selectedTransmission}")
+        # Log the key, not the transmission: str(Transmission) includes the
+        # full transcription.
+        self.log(f"Transmission selected: {message.key}")
 
         # Pass down to details view
-        transmissionDetails = cast(
-            TransmissionDetails, self.query_one("TransmissionDetails")
-        )
-        transmissionDetails.transmission = transmissionAsTuple(
-            message.key, self.selectedTransmission
-        )
+        transmissionDetails = self._transmissionDetails
+        assert transmissionDetails is not None
+        transmissionDetails.transmission = self._tupleByKey[message.key]
 
     @on(SearchField.QueryUpdated)
     async def handleSearchQueryUpdated(self, message: SearchField.QueryUpdated) -> None:
         searchQuery = message.query
-        transmissionList = cast(TransmissionList, self.query_one("TransmissionList"))
-        footer = cast(Footer, self.query_one("Footer"))
+        transmissionList = self._transmissionList
+        footer = self._footer
+        assert transmissionList is not None
+        assert footer is not None
 
         if searchQuery:
             self.log(f"Search query: {searchQuery}")
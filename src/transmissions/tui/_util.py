@@ -1,26 +1,64 @@
 from datetime import datetime as DateTime
-
-from arrow import get as makeArrow
-from rich.markup import escape
+from functools import lru_cache
+from typing import NamedTuple
+from zoneinfo import ZoneInfo
 
 
 __all__ = ()
 
 
-TransmissionTuple = tuple[
-    str, str, str, str, str, str, float | None, str, str | None, str | None
-]
+class TransmissionTuple(NamedTuple):
+    """
+    Transmission data packed for display: same compact tuple memory layout,
+    but hot paths get named C-level attribute access instead of indexing.
+    """
+
+    key: str
+    eventID: str
+    station: str
+    system: str
+    channel: str
+    startTime: str
+    duration: float | None
+    path: str
+    sha256: str | None
+    transcription: str | None
+    # Native startTime, so sorting needs no text re-parse
+    startTimeRaw: DateTime
+
+
+# Rich markup only needs "[" protected; a translation table does that in a
+# single C-level pass, unlike rich.markup.escape's regex substitution.
+_RICH_ESCAPE = str.maketrans({"[": r"\["})
+
+
+@lru_cache(maxsize=8192)
+def fastEscape(text: str) -> str:
+    # Memoized: fields like eventID, system, channel, and station take few
+    # distinct values across a dataset, so repeats skip the scan and copy.
+    return text.translate(_RICH_ESCAPE)
 
 
 def optionalEscape(text: str | None) -> str | None:
     if text is None:
         return None
-    return escape(text)
+    return fastEscape(text)
 
 
+@lru_cache(maxsize=65536)
 def dateTimeAsText(datetime: DateTime) -> str:
-    return str(makeArrow(datetime))
+    return datetime.isoformat()
 
 
+@lru_cache(maxsize=65536)
 def dateTimeFromText(text: str) -> DateTime:
-    return makeArrow(text).datetime
+    return DateTime.fromisoformat(text)
+
+
+@lru_cache(maxsize=4096)
+def dateTimeTextAsDisplayText(text: str, timeZone: str, format: str) -> str:
+    """
+    Format a datetime, given as ISO 8601 text, for display; memoized, and
+    parsed, zone-converted, and formatted entirely with C-level stdlib calls.
+    """
+    return DateTime.fromisoformat(text).astimezone(ZoneInfo(timeZone)).strftime(format)